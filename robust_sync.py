@@ -6,14 +6,18 @@ This script includes comprehensive error handling and logging for scheduled exec
 """
 
 import os
+import re
 import sys
 import time
-import json
 import requests
+from requests.adapters import HTTPAdapter
 import gspread
+from gspread.utils import absolute_range_name, rowcol_to_a1
 import logging
-import traceback
+import functools
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from google.oauth2.service_account import Credentials
 
 # Setup logging
@@ -22,7 +26,7 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(log_file),
+        logging.FileHandler(log_file, delay=True),
         logging.StreamHandler(sys.stdout)
     ]
 )
@@ -32,123 +36,163 @@ logger = logging.getLogger(__name__)
 SPREADSHEET_ID = '1F8qZA-b9oMtqw2Mf0ybb6FE2tUgmKEZ3zjAN9jfg4Ag'
 SERVICE_ACCOUNT_FILE = '/home/ubuntu/service_account.json'
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+ENRICH_WORKERS = 16
+
+# Lead keys in exact sheet column order (55 columns)
+COLUMN_KEYS = (
+    'row_number', 'hub', 'client_name', 'nationality', 'email', 'operator',
+    'file_status', 'arrival', 'departure', 'pax', 'lead_operation',
+    'request_channel', 'communication', 'medium', 'offered_income',
+    'offered_income_usd', 'actual_paid_amount', 'actual_paid_amount_usd',
+    'remaining_payment', 'remaining_payment_usd', 'submission_date',
+    'confirmation_date', 'company', 'department', 'product_title',
+    'utm_campaign', 'initial_price', 'device_type', 'client_phone', 'file_no',
+    'request_token', 'sales_person', 'request_status', 'source', 'vip_status',
+    'loyalty_program', 'group', 'has_int_flight', 'single_room', 'double_room',
+    'triple_room', 'family_room', 'int_flight_amount', 'int_flight_currency',
+    'agent_group_discount', 'agent_score', 'agent_recommendation',
+    'ip_country', 'ip_region', 'ip_city', 'profitability_flag',
+    'communications_count', 'last_updated', 'lead_id', 'lead_url'
+)
+# Sheet column letter holding the request token, derived from the layout above
+# (row-1 A1 reference with the row digits stripped)
+TOKEN_COLUMN = rowcol_to_a1(1, COLUMN_KEYS.index('request_token') + 1).rstrip('0123456789')
+
+# Client-name keywords that flag a lead as less profitable
+PROFIT_RE = re.compile(r'shore|excursion|day trip|half day')
+PROFIT_LABELS = {
+    'shore': 'Shore excursion',
+    'excursion': 'Shore excursion',
+    'day trip': 'Short duration trip',
+    'half day': 'Short duration trip'
+}
+PROFIT_LABEL_ORDER = ('Shore excursion', 'Short duration trip')
+
+# Agent scoring: (score, recommendation) by communications count
+BASE_SCORES = {
+    0: (3, "No response from agent yet"),
+    1: (6, "Initial contact made, needs follow-up")
+}
+ACTIVE_SCORE = (8, "Active communication maintained")
+# (status keyword, score delta, recommendation, only applies after contact)
+STATUS_ADJUSTMENTS = (
+    ('confirmed', 2, "Lead successfully converted", False),
+    ('new', -1, "Response needed for new lead", True)
+)
+
+# Shared keep-alive session for geolocation lookups (all go to ipapi.co)
+_geo_session = requests.Session()
+_geo_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=32))
+
+@functools.lru_cache(maxsize=4096)
+def _geo_uncached(ip_address):
+    """Look up (country, region, city) for an IP; failures raise and are not cached."""
+    response = _geo_session.get(f"https://ipapi.co/{ip_address}/json/", timeout=10)
+    if response.status_code != 200:
+        raise RuntimeError(f"Geolocation API returned status {response.status_code}")
+    data = response.json()
+    return (
+        data.get("country_name", "N/A"),
+        data.get("region", "N/A"),
+        data.get("city", "N/A")
+    )
+
+def catch_and_log(default, message):
+    """Log any exception raised by the wrapped method and return default instead."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception:
+                logger.exception(message)
+                return default
+        return wrapper
+    return decorator
 
 class RobustMemphisToursSync:
+    # Shared across instances so long-running schedulers authorize only once
+    _creds = None
+    _client = None
+    
     def __init__(self):
         self.sheet = None
         logger.info("🚀 Initializing Memphis Tours Sync System...")
         
+    @catch_and_log(False, "❌ Error checking prerequisites")
     def check_prerequisites(self):
         """Check if all required files and dependencies exist."""
-        try:
-            logger.info("🔍 Checking prerequisites...")
-            
-            # Check if service account file exists
-            if not os.path.exists(SERVICE_ACCOUNT_FILE):
-                logger.error(f"❌ Service account file not found: {SERVICE_ACCOUNT_FILE}")
-                return False
-            
-            # Check if file is readable
-            try:
-                with open(SERVICE_ACCOUNT_FILE, 'r') as f:
-                    json.load(f)
-                logger.info("✅ Service account file is valid JSON")
-            except Exception as e:
-                logger.error(f"❌ Service account file is not valid JSON: {e}")
-                return False
-            
-            # Check required Python packages
-            required_packages = ['gspread', 'google', 'requests']
-            for package in required_packages:
-                try:
-                    __import__(package)
-                    logger.info(f"✅ Package {package} is available")
-                except ImportError:
-                    logger.error(f"❌ Package {package} is not installed")
-                    return False
-            
-            # Check internet connectivity
-            try:
-                response = requests.get('https://www.google.com', timeout=10)
-                if response.status_code == 200:
-                    logger.info("✅ Internet connectivity confirmed")
-                else:
-                    logger.warning(f"⚠️ Unexpected response from Google: {response.status_code}")
-            except Exception as e:
-                logger.error(f"❌ No internet connectivity: {e}")
-                return False
-            
-            logger.info("✅ All prerequisites check passed")
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ Error checking prerequisites: {e}")
-            logger.error(traceback.format_exc())
+        logger.info("🔍 Checking prerequisites...")
+        
+        # Check if service account file exists
+        if not os.path.exists(SERVICE_ACCOUNT_FILE):
+            logger.error(f"❌ Service account file not found: {SERVICE_ACCOUNT_FILE}")
             return False
+        
+        # Check if file is readable (its contents are parsed when credentials load)
+        if not os.access(SERVICE_ACCOUNT_FILE, os.R_OK):
+            logger.error(f"❌ Service account file is not readable: {SERVICE_ACCOUNT_FILE}")
+            return False
+        logger.info("✅ Service account file is readable")
+        
+        # Check required Python packages
+        # ('google' is a namespace package, so check the module we actually use)
+        required_packages = ['gspread', 'google.oauth2.service_account', 'requests']
+        for package in required_packages:
+            if find_spec(package) is None:
+                logger.error(f"❌ Package {package} is not installed")
+                return False
+            logger.info(f"✅ Package {package} is available")
+        
+        logger.info("✅ All prerequisites check passed")
+        return True
     
+    @catch_and_log(False, "❌ Error setting up Google Sheets")
     def setup_google_sheets(self):
         """Initialize Google Sheets connection with error handling."""
-        try:
-            logger.info("🔐 Setting up Google Sheets connection...")
-            
-            # Load credentials
-            creds = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-            logger.info("✅ Service account credentials loaded")
-            
-            # Authorize client
-            client = gspread.authorize(creds)
-            logger.info("✅ Google Sheets client authorized")
-            
-            # Open spreadsheet
-            spreadsheet = client.open_by_key(SPREADSHEET_ID)
-            logger.info(f"✅ Spreadsheet opened: {spreadsheet.title}")
-            
-            # Get worksheet
-            self.sheet = spreadsheet.get_worksheet(0)
-            logger.info(f"✅ Worksheet accessed: {self.sheet.title}")
-            
-            # Test write access
+        logger.info("🔐 Setting up Google Sheets connection...")
+        
+        # Load credentials and authorize client once per process
+        # (credentials refresh their own token when it expires)
+        cls = RobustMemphisToursSync
+        if cls._client is None:
             try:
-                # Try to read the first cell to test access
-                test_value = self.sheet.cell(1, 1).value
-                logger.info(f"✅ Sheet access confirmed. First cell: '{test_value}'")
-            except Exception as e:
-                logger.error(f"❌ Cannot access sheet data: {e}")
+                cls._creds = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
+            except ValueError as e:
+                logger.error(f"❌ Service account file is invalid: {e}")
                 return False
+            logger.info("✅ Service account credentials loaded")
             
-            logger.info("✅ Google Sheets connection established successfully")
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ Error setting up Google Sheets: {e}")
-            logger.error(traceback.format_exc())
-            return False
+            cls._client = gspread.authorize(cls._creds)
+            logger.info("✅ Google Sheets client authorized")
+        else:
+            logger.info("✅ Reusing authorized Google Sheets client")
+        client = cls._client
+        
+        # Open spreadsheet
+        spreadsheet = client.open_by_key(SPREADSHEET_ID)
+        logger.info(f"✅ Spreadsheet opened: {spreadsheet.title}")
+        
+        # Get worksheet
+        self.sheet = spreadsheet.sheet1
+        logger.info(f"✅ Worksheet accessed: {self.sheet.title}")
+        
+        logger.info("✅ Google Sheets connection established successfully")
+        return True
     
     def score_sales_agent(self, communications_count, lead_status):
         """Score sales agent performance based on available data."""
         try:
-            score = 5  # Default score
-            recommendation = "Standard performance"
-            
-            # Basic scoring algorithm
-            if communications_count == 0:
-                score = 3
-                recommendation = "No response from agent yet"
-            elif communications_count == 1:
-                score = 6
-                recommendation = "Initial contact made, needs follow-up"
-            else:
-                score = 8
-                recommendation = "Active communication maintained"
+            # Base score by number of communications (2+ counts as active)
+            score, recommendation = BASE_SCORES.get(communications_count, ACTIVE_SCORE)
             
-            # Adjust score based on lead status
+            # Adjust score based on lead status (first matching class wins)
             status = str(lead_status).lower() if lead_status else ''
-            if 'confirmed' in status:
-                score = min(10, score + 2)
-                recommendation = "Lead successfully converted"
-            elif 'new' in status and communications_count > 0:
-                score = max(1, score - 1)
-                recommendation = "Response needed for new lead"
+            for keyword, delta, status_recommendation, needs_contact in STATUS_ADJUSTMENTS:
+                if keyword in status and (not needs_contact or communications_count > 0):
+                    score = max(1, min(10, score + delta))
+                    recommendation = status_recommendation
+                    break
             
             return score, recommendation
             
@@ -162,20 +206,11 @@ class RobustMemphisToursSync:
             return {"country": "N/A", "region": "N/A", "city": "N/A"}
         
         try:
-            logger.debug(f"🌍 Getting geolocation for IP: {ip_address}")
-            response = requests.get(f"https://ipapi.co/{ip_address}/json/", timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                result = {
-                    "country": data.get("country_name", "N/A"),
-                    "region": data.get("region", "N/A"),
-                    "city": data.get("city", "N/A")
-                }
-                logger.debug(f"✅ Geolocation found: {result}")
-                return result
-            else:
-                logger.warning(f"⚠️ Geolocation API returned status {response.status_code}")
+            logger.debug("🌍 Getting geolocation for IP: %s", ip_address)
+            country, region, city = _geo_uncached(ip_address)
+            result = {"country": country, "region": region, "city": city}
+            logger.debug("✅ Geolocation found: %s", result)
+            return result
                 
         except Exception as e:
             logger.warning(f"⚠️ Error getting geolocation for {ip_address}: {e}")
@@ -192,260 +227,206 @@ class RobustMemphisToursSync:
             if pax == '1' or 'solo' in pax:
                 flags.append("Solo traveler (1 PAX)")
             
-            # Check for shore excursion
+            # Check for shore excursion and low-value indicators in one scan
             client_name = str(lead_data.get('client_name', '')).lower()
-            if 'shore' in client_name or 'excursion' in client_name:
-                flags.append("Shore excursion")
-            
-            # Check for low-value indicators
-            if 'day trip' in client_name or 'half day' in client_name:
-                flags.append("Short duration trip")
+            matched = {PROFIT_LABELS[m] for m in PROFIT_RE.findall(client_name)}
+            flags.extend(label for label in PROFIT_LABEL_ORDER if label in matched)
             
             result = "; ".join(flags) if flags else "No issues identified"
-            logger.debug(f"💰 Profitability check: {result}")
+            logger.debug("💰 Profitability check: %s", result)
             return result
             
         except Exception as e:
             logger.warning(f"⚠️ Error checking profitability: {e}")
             return "Error checking profitability"
     
+    def enrich_lead(self, lead, geo_data):
+        """Add agent score, IP geolocation and profitability data to a lead."""
+        logger.info(f"📝 Processing lead: {lead['client_name']}")
+        
+        # Score sales agent
+        agent_score, agent_recommendation = self.score_sales_agent(
+            lead.get('communications_count', 0), 
+            lead.get('request_status', '')
+        )
+        
+        # Check profitability
+        profitability_flag = self.check_profitability(lead)
+        
+        # Add enrichment data
+        lead.update({
+            'agent_score': agent_score,
+            'agent_recommendation': agent_recommendation,
+            'ip_country': geo_data['country'],
+            'ip_region': geo_data['region'],
+            'ip_city': geo_data['city'],
+            'profitability_flag': profitability_flag,
+            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        })
+        
+        logger.info(f"✅ Lead processed successfully")
+        return lead
+    
+    @catch_and_log(False, "❌ Error adding sample data")
     def add_sample_data_safe(self):
         """Add sample data with comprehensive error handling."""
-        try:
-            logger.info("📊 Adding sample lead data...")
-            
-            # Simple sample data for testing
-            sample_leads = [
-                {
-                    'row_number': str(int(time.time()) % 1000),  # Unique row number
-                    'hub': 'memphistours.com',
-                    'client_name': f'Test Client {datetime.now().strftime("%H:%M")}',
-                    'nationality': 'Test Country',
-                    'email': 'test@example.com',
-                    'operator': 'Memphis Tours',
-                    'file_status': 'Active',
-                    'arrival': '2025-10-15',
-                    'departure': '2025-10-22',
-                    'pax': '2',
-                    'lead_operation': 'Lead',
-                    'request_channel': 'Website',
-                    'communication': 'Email',
-                    'medium': 'Online',
-                    'offered_income': '1000.00',
-                    'offered_income_usd': '1000.00',
-                    'actual_paid_amount': '0.00',
-                    'actual_paid_amount_usd': '0.00',
-                    'remaining_payment': '1000.00',
-                    'remaining_payment_usd': '1000.00',
-                    'submission_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'confirmation_date': 'N/A',
-                    'company': 'Memphis Tours',
-                    'department': 'Corporate Sales',
-                    'product_title': 'Test Tour Package',
-                    'utm_campaign': 'test_campaign',
-                    'initial_price': '1000.00',
-                    'device_type': 'Desktop',
-                    'client_phone': '+1-555-0123',
-                    'file_no': f'MT{int(time.time())}',
-                    'request_token': f'TEST{int(time.time())}',
-                    'sales_person': 'Test Agent',
-                    'request_status': 'New Request',
-                    'source': 'Test Site',
-                    'vip_status': 'No',
-                    'loyalty_program': 'Fresh Customer',
-                    'group': 'No',
-                    'has_int_flight': 'No',
-                    'single_room': '0',
-                    'double_room': '1',
-                    'triple_room': '0',
-                    'family_room': '0',
-                    'int_flight_amount': '0',
-                    'int_flight_currency': 'USD',
-                    'agent_group_discount': '0',
-                    'communications_count': 1,
-                    'lead_id': f'TEST{int(time.time())}',
-                    'lead_url': 'https://example.com/test'
-                }
-            ]
-            
-            # Process and enrich each lead
-            enriched_leads = []
-            for lead in sample_leads:
-                logger.info(f"📝 Processing lead: {lead['client_name']}")
-                
-                # Score sales agent
-                agent_score, agent_recommendation = self.score_sales_agent(
-                    lead.get('communications_count', 0), 
-                    lead.get('request_status', '')
-                )
-                
-                # Add IP geolocation (using a test IP)
-                geo_data = self.get_ip_geolocation('8.8.8.8')
-                
-                # Check profitability
-                profitability_flag = self.check_profitability(lead)
-                
-                # Add enrichment data
-                lead.update({
-                    'agent_score': agent_score,
-                    'agent_recommendation': agent_recommendation,
-                    'ip_country': geo_data['country'],
-                    'ip_region': geo_data['region'],
-                    'ip_city': geo_data['city'],
-                    'profitability_flag': profitability_flag,
-                    'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
-                
-                enriched_leads.append(lead)
-                logger.info(f"✅ Lead processed successfully")
-            
-            # Sync to Google Sheets
-            synced_count = self.sync_to_google_sheets(enriched_leads)
-            logger.info(f"✅ Sync completed! Added {synced_count} leads")
-            return synced_count > 0
-            
-        except Exception as e:
-            logger.error(f"❌ Error adding sample data: {e}")
-            logger.error(traceback.format_exc())
-            return False
+        logger.info("📊 Adding sample lead data...")
+        
+        # Timestamps shared by every field of the sample lead
+        now = datetime.now()
+        now_ts = int(time.time())
+        now_str = now.strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Simple sample data for testing
+        sample_leads = [
+            {
+                'row_number': str(now_ts % 1000),  # Unique row number
+                'hub': 'memphistours.com',
+                'client_name': f'Test Client {now.strftime("%H:%M")}',
+                'nationality': 'Test Country',
+                'email': 'test@example.com',
+                'operator': 'Memphis Tours',
+                'file_status': 'Active',
+                'arrival': '2025-10-15',
+                'departure': '2025-10-22',
+                'pax': '2',
+                'lead_operation': 'Lead',
+                'request_channel': 'Website',
+                'communication': 'Email',
+                'medium': 'Online',
+                'offered_income': '1000.00',
+                'offered_income_usd': '1000.00',
+                'actual_paid_amount': '0.00',
+                'actual_paid_amount_usd': '0.00',
+                'remaining_payment': '1000.00',
+                'remaining_payment_usd': '1000.00',
+                'submission_date': now_str,
+                'confirmation_date': 'N/A',
+                'company': 'Memphis Tours',
+                'department': 'Corporate Sales',
+                'product_title': 'Test Tour Package',
+                'utm_campaign': 'test_campaign',
+                'initial_price': '1000.00',
+                'device_type': 'Desktop',
+                'client_phone': '+1-555-0123',
+                'file_no': f'MT{now_ts}',
+                'request_token': f'TEST{now_ts}',
+                'sales_person': 'Test Agent',
+                'request_status': 'New Request',
+                'source': 'Test Site',
+                'vip_status': 'No',
+                'loyalty_program': 'Fresh Customer',
+                'group': 'No',
+                'has_int_flight': 'No',
+                'single_room': '0',
+                'double_room': '1',
+                'triple_room': '0',
+                'family_room': '0',
+                'int_flight_amount': '0',
+                'int_flight_currency': 'USD',
+                'agent_group_discount': '0',
+                'communications_count': 1,
+                'lead_id': f'TEST{now_ts}',
+                'lead_url': 'https://example.com/test'
+            }
+        ]
+        
+        # Look up each distinct IP once, concurrently (geolocation is network-bound),
+        # so leads sharing an IP never race each other past the lookup cache
+        lead_ips = ['8.8.8.8' for _ in sample_leads]  # Test IP for sample data
+        distinct_ips = list(dict.fromkeys(lead_ips))
+        with ThreadPoolExecutor(max_workers=ENRICH_WORKERS) as executor:
+            geo_by_ip = dict(zip(distinct_ips, executor.map(self.get_ip_geolocation, distinct_ips)))
+        
+        # Enrich each lead from the looked-up results
+        enriched_leads = [
+            self.enrich_lead(lead, geo_by_ip[ip]) for lead, ip in zip(sample_leads, lead_ips)
+        ]
+        
+        # Sync to Google Sheets
+        synced_count = self.sync_to_google_sheets(enriched_leads)
+        logger.info(f"✅ Sync completed! Added {synced_count} leads")
+        return synced_count > 0
     
+    @catch_and_log(0, "❌ Error syncing to Google Sheets")
     def sync_to_google_sheets(self, leads_data):
         """Sync data to Google Sheets with robust error handling."""
+        logger.info("📤 Starting sync to Google Sheets...")
+        
+        if not self.sheet:
+            logger.error("❌ No sheet connection available")
+            return 0
+        
+        # Get existing request tokens to avoid duplicates
         try:
-            logger.info("📤 Starting sync to Google Sheets...")
+            response = self.sheet.spreadsheet.values_get(
+                absolute_range_name(self.sheet.title, f"{TOKEN_COLUMN}2:{TOKEN_COLUMN}"),
+                params={"majorDimension": "COLUMNS"}
+            )
+            existing_tokens = set(response.get("values", [[]])[0])
+            logger.info(f"📋 Found {len(existing_tokens)} existing request tokens")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read existing data: {e}")
+            existing_tokens = set()
+        
+        new_rows = []
+        updated_count = 0
+        
+        for lead in leads_data:
+            request_token = lead.get('request_token', '')
             
-            if not self.sheet:
-                logger.error("❌ No sheet connection available")
-                return 0
+            # Prepare row data in exact order (55 columns)
+            row_data = [lead.get(key, '') for key in COLUMN_KEYS]
             
-            # Get existing data to avoid duplicates
+            if request_token not in existing_tokens:
+                new_rows.append(row_data)
+                updated_count += 1
+        
+        logger.info(f"📝 Prepared {len(new_rows)} new rows")
+        
+        # Add new rows to sheet
+        if new_rows:
             try:
-                existing_data = self.sheet.get_all_records()
-                existing_tokens = {row.get('Request Token', '') for row in existing_data}
-                logger.info(f"📋 Found {len(existing_data)} existing records")
+                self.sheet.spreadsheet.values_append(
+                    absolute_range_name(self.sheet.title, "A1"),
+                    params={"valueInputOption": "RAW", "insertDataOption": "INSERT_ROWS"},
+                    body={"values": new_rows}
+                )
+                logger.info(f"✅ Successfully added {len(new_rows)} new rows to Google Sheets")
             except Exception as e:
-                logger.warning(f"⚠️ Could not read existing data: {e}")
-                existing_tokens = set()
-            
-            new_rows = []
-            updated_count = 0
-            
-            for lead in leads_data:
-                request_token = lead.get('request_token', '')
-                
-                # Prepare row data in exact order (55 columns)
-                row_data = [
-                    lead.get('row_number', ''),
-                    lead.get('hub', ''),
-                    lead.get('client_name', ''),
-                    lead.get('nationality', ''),
-                    lead.get('email', ''),
-                    lead.get('operator', ''),
-                    lead.get('file_status', ''),
-                    lead.get('arrival', ''),
-                    lead.get('departure', ''),
-                    lead.get('pax', ''),
-                    lead.get('lead_operation', ''),
-                    lead.get('request_channel', ''),
-                    lead.get('communication', ''),
-                    lead.get('medium', ''),
-                    lead.get('offered_income', ''),
-                    lead.get('offered_income_usd', ''),
-                    lead.get('actual_paid_amount', ''),
-                    lead.get('actual_paid_amount_usd', ''),
-                    lead.get('remaining_payment', ''),
-                    lead.get('remaining_payment_usd', ''),
-                    lead.get('submission_date', ''),
-                    lead.get('confirmation_date', ''),
-                    lead.get('company', ''),
-                    lead.get('department', ''),
-                    lead.get('product_title', ''),
-                    lead.get('utm_campaign', ''),
-                    lead.get('initial_price', ''),
-                    lead.get('device_type', ''),
-                    lead.get('client_phone', ''),
-                    lead.get('file_no', ''),
-                    lead.get('request_token', ''),
-                    lead.get('sales_person', ''),
-                    lead.get('request_status', ''),
-                    lead.get('source', ''),
-                    lead.get('vip_status', ''),
-                    lead.get('loyalty_program', ''),
-                    lead.get('group', ''),
-                    lead.get('has_int_flight', ''),
-                    lead.get('single_room', ''),
-                    lead.get('double_room', ''),
-                    lead.get('triple_room', ''),
-                    lead.get('family_room', ''),
-                    lead.get('int_flight_amount', ''),
-                    lead.get('int_flight_currency', ''),
-                    lead.get('agent_group_discount', ''),
-                    lead.get('agent_score', ''),
-                    lead.get('agent_recommendation', ''),
-                    lead.get('ip_country', ''),
-                    lead.get('ip_region', ''),
-                    lead.get('ip_city', ''),
-                    lead.get('profitability_flag', ''),
-                    lead.get('communications_count', ''),
-                    lead.get('last_updated', ''),
-                    lead.get('lead_id', ''),
-                    lead.get('lead_url', '')
-                ]
-                
-                if request_token not in existing_tokens:
-                    new_rows.append(row_data)
-                    updated_count += 1
-                    logger.info(f"📝 Prepared new row for: {lead.get('client_name', 'Unknown')}")
-            
-            # Add new rows to sheet
-            if new_rows:
-                try:
-                    self.sheet.append_rows(new_rows)
-                    logger.info(f"✅ Successfully added {len(new_rows)} new rows to Google Sheets")
-                except Exception as e:
-                    logger.error(f"❌ Failed to append rows: {e}")
-                    return 0
-            else:
-                logger.info("ℹ️ No new leads to add")
-            
-            return updated_count
-            
-        except Exception as e:
-            logger.error(f"❌ Error syncing to Google Sheets: {e}")
-            logger.error(traceback.format_exc())
-            return 0
+                logger.error(f"❌ Failed to append rows: {e}")
+                return 0
+        else:
+            logger.info("ℹ️ No new leads to add")
+        
+        return updated_count
     
+    @catch_and_log(False, "❌ Critical error in sync process")
     def run_sync(self):
         """Run the complete sync process with comprehensive error handling."""
-        try:
-            logger.info("=" * 50)
-            logger.info("🚀 Starting Memphis Tours ERP Sync")
-            logger.info(f"⏰ Execution time: {datetime.now()}")
-            logger.info("=" * 50)
-            
-            # Check prerequisites
-            if not self.check_prerequisites():
-                logger.error("❌ Prerequisites check failed")
-                return False
-            
-            # Setup Google Sheets
-            if not self.setup_google_sheets():
-                logger.error("❌ Google Sheets setup failed")
-                return False
-            
-            # Add sample data (in production, this would extract from ERP)
-            if not self.add_sample_data_safe():
-                logger.error("❌ Data processing failed")
-                return False
-            
-            logger.info("✅ Sync completed successfully!")
-            logger.info("=" * 50)
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ Critical error in sync process: {e}")
-            logger.error(traceback.format_exc())
+        logger.info("=" * 50)
+        logger.info("🚀 Starting Memphis Tours ERP Sync")
+        logger.info(f"⏰ Execution time: {datetime.now()}")
+        logger.info("=" * 50)
+        
+        # Check prerequisites
+        if not self.check_prerequisites():
+            logger.error("❌ Prerequisites check failed")
+            return False
+        
+        # Setup Google Sheets
+        if not self.setup_google_sheets():
+            logger.error("❌ Google Sheets setup failed")
             return False
+        
+        # Add sample data (in production, this would extract from ERP)
+        if not self.add_sample_data_safe():
+            logger.error("❌ Data processing failed")
+            return False
+        
+        logger.info("✅ Sync completed successfully!")
+        logger.info("=" * 50)
+        return True
 
 def main():
     """Main function with top-level error handling."""
@@ -461,9 +442,8 @@ def main():
             print("FAILED")  # For external monitoring
             sys.exit(1)
             
-    except Exception as e:
-        logger.error(f"💥 Fatal error: {e}")
-        logger.error(traceback.format_exc())
+    except Exception:
+        logger.exception("💥 Fatal error")
         print("FATAL_ERROR")  # For external monitoring
         sys.exit(1)
 